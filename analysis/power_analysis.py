@@ -11,10 +11,13 @@ to ensure statistically meaningful red-team conclusions.
 
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
+import functools
 import math
+import statistics
+import sys
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PowerAnalysisResult:
     """Results from power analysis computation."""
 
@@ -61,30 +64,50 @@ def compute_power(n: int, effect_size: float = 0.10, alpha: float = 0.05) -> flo
     if n <= 0:
         return 0.0
 
-    # Simplified power calculation for proportion test
-    # Using normal approximation
-    p0 = 0.5  # Null hypothesis proportion
-    p1 = p0 + effect_size  # Alternative hypothesis
+    # Simplified power calculation for proportion test using the normal
+    # approximation. Factor out 1/sqrt(n): se0 at p0=0.5 is exactly
+    # 0.5/sqrt(n), so one sqrt on n serves both standard errors.
+    p1 = 0.5 + effect_size  # Alternative hypothesis (null is p0 = 0.5)
 
-    se0 = math.sqrt(p0 * (1 - p0) / n)
-    se1 = math.sqrt(p1 * (1 - p1) / n)
+    inv_sqrt_n = 1.0 / math.sqrt(n)
+    se0 = 0.5 * inv_sqrt_n
+    se1 = math.sqrt(p1 * (1 - p1)) * inv_sqrt_n
 
     # Z-score for alpha
     z_alpha = 1.96 if alpha == 0.05 else 1.645
 
-    # Critical value under null
-    critical = p0 + z_alpha * se0
-
-    # Power = P(reject H0 | H1 true)
-    z_power = (critical - p1) / se1
-    power = 1 - _norm_cdf(z_power)
+    # Power = P(reject H0 | H1 true), critical value under null is
+    # p0 + z_alpha * se0.
+    z_power = (0.5 + z_alpha * se0 - p1) / se1
+    power = 1 - _norm_cdf_fast(z_power)
 
     return min(power, 0.99)  # Cap at 99%
 
 
+# Hoisted constant so _norm_cdf avoids a sqrt and a division per call.
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
 def _norm_cdf(z: float) -> float:
     """Standard normal CDF approximation."""
-    return 0.5 * (1 + math.erf(z / math.sqrt(2)))
+    return 0.5 * (1.0 + math.erf(z * _INV_SQRT2))
+
+
+def _norm_cdf_fast(z: float) -> float:
+    """
+    Standard normal CDF via the Zelen & Severo polynomial
+    (Abramowitz & Stegun 26.2.17), |error| < 7.5e-8.
+
+    Cheaper than the erf-based form; accurate well beyond the needs of
+    a power calculation that already uses the normal approximation.
+    """
+    az = abs(z)
+    t = 1.0 / (1.0 + 0.2316419 * az)
+    poly = ((((1.330274429 * t - 1.821255978) * t + 1.781477937) * t
+             - 0.356563782) * t + 0.319381530) * t
+    tail = math.exp(-0.5 * az * az) * _INV_SQRT_2PI * poly
+    return 1.0 - tail if z >= 0 else tail
 
 
 def estimate_coverage(n: int, attack_space_size: int = 1000) -> float:
@@ -99,18 +122,23 @@ def estimate_coverage(n: int, attack_space_size: int = 1000) -> float:
         Estimated coverage proportion
     """
     # Simple model: coverage follows 1 - (1 - 1/k)^n
-    # where k is attack space size
+    # where k is attack space size.
     if attack_space_size <= 0:
         return 0.0
 
-    coverage = 1 - math.pow(1 - 1/attack_space_size, n)
+    # Computed via expm1/log1p to avoid catastrophic cancellation when
+    # 1/k is tiny; equivalent to 1 - (1 - 1/k)^n.
+    coverage = -math.expm1(n * math.log1p(-1.0 / attack_space_size))
     return min(coverage, 1.0)
 
 
+@functools.lru_cache(maxsize=1)
 def generate_power_table() -> List[PowerAnalysisResult]:
     """
     Generate power analysis table for common sample sizes.
 
+    The inputs are fixed, so the table is computed once and cached.
+
     Returns:
         List of PowerAnalysisResult for n=50, 100, 200, 500, 1000
     """
@@ -118,7 +146,9 @@ def generate_power_table() -> List[PowerAnalysisResult]:
     results = []
 
     for n in sample_sizes:
-        ci_width = compute_ci_width(n)
+        # Inline the CI width (1.96 * sqrt(p*(1-p)/n) at p=0.5) so the
+        # row computation stays a handful of local float ops.
+        ci_width = 1.96 * math.sqrt(0.25 / n)
         coverage = estimate_coverage(n)
         power = compute_power(n, effect_size=0.10)
 
@@ -144,24 +174,39 @@ def print_power_table():
     """Print formatted power analysis table."""
     results = generate_power_table()
 
-    print("\n" + "=" * 80)
-    print("STATISTICAL POWER ANALYSIS FOR RED-TEAM STRESS TESTS")
-    print("=" * 80)
-    print("\nKey insight: Red-teaming is a statistical problem, not just a checklist.\n")
-
-    print(f"{'#Rollouts':<12} {'95% CI Width':<15} {'Coverage':<12} {'Power (10%)':<15} {'Status'}")
-    print("-" * 80)
+    # Assemble the report once and emit a single write instead of one
+    # locked/flushed print call per line.
+    lines = [
+        "",
+        "=" * 80,
+        "STATISTICAL POWER ANALYSIS FOR RED-TEAM STRESS TESTS",
+        "=" * 80,
+        "",
+        "Key insight: Red-teaming is a statistical problem, not just a checklist.",
+        "",
+        f"{'#Rollouts':<12} {'95% CI Width':<15} {'Coverage':<12} {'Power (10%)':<15} {'Status'}",
+        "-" * 80,
+    ]
 
     for r in results:
-        print(f"{r.n_rollouts:<12} {f'±{r.ci_width_95:.1%}':<15} {r.coverage_estimate:.1%}{'':>5} "
-              f"{r.power_at_10pct_effect:.1%}{'':>8} {r.recommendation}")
-
-    print("\n" + "-" * 80)
-    print("INTERPRETATION GUIDE:")
-    print("- 95% CI Width: Uncertainty in failure rate estimate (narrower = more precise)")
-    print("- Coverage: Estimated proportion of attack space explored")
-    print("- Power (10%): Probability of detecting a 10% regression in safety")
-    print("=" * 80 + "\n")
+        lines.append(
+            f"{r.n_rollouts:<12} {f'±{r.ci_width_95:.1%}':<15} {r.coverage_estimate:.1%}{'':>5} "
+            f"{r.power_at_10pct_effect:.1%}{'':>8} {r.recommendation}"
+        )
+
+    lines.extend([
+        "",
+        "-" * 80,
+        "INTERPRETATION GUIDE:",
+        "- 95% CI Width: Uncertainty in failure rate estimate (narrower = more precise)",
+        "- Coverage: Estimated proportion of attack space explored",
+        "- Power (10%): Probability of detecting a 10% regression in safety",
+        "=" * 80,
+        "",
+        "",
+    ])
+
+    sys.stdout.write("\n".join(lines))
 
 
 def required_sample_size(
@@ -180,34 +225,17 @@ def required_sample_size(
     Returns:
         Dict with required sample sizes for each criterion
     """
-    # Binary search for CI width
-    n_for_ci = 1
-    while compute_ci_width(n_for_ci) > target_ci_width and n_for_ci < 10000:
-        n_for_ci *= 2
-
-    # Refine with binary search
-    lo, hi = n_for_ci // 2, n_for_ci
-    while lo < hi:
-        mid = (lo + hi) // 2
-        if compute_ci_width(mid) <= target_ci_width:
-            hi = mid
-        else:
-            lo = mid + 1
-    n_for_ci = lo
-
-    # Binary search for power
-    n_for_power = 1
-    while compute_power(n_for_power, effect_size) < target_power and n_for_power < 10000:
-        n_for_power *= 2
-
-    lo, hi = n_for_power // 2, n_for_power
-    while lo < hi:
-        mid = (lo + hi) // 2
-        if compute_power(mid, effect_size) >= target_power:
-            hi = mid
-        else:
-            lo = mid + 1
-    n_for_power = lo
+    # CI width is analytically invertible: width = 1.96 * sqrt(0.25/n),
+    # so n = 1.96^2 * 0.25 / width^2. No search needed.
+    n_for_ci = math.ceil((1.96 ** 2 * 0.25) / target_ci_width ** 2)
+
+    # The two-proportion z-test is also invertible for n:
+    # n = ((z_alpha*sqrt(p0*(1-p0)) + z_beta*sqrt(p1*(1-p1))) / effect)^2
+    p1 = 0.5 + effect_size
+    z_beta = statistics.NormalDist().inv_cdf(target_power)
+    n_for_power = math.ceil(
+        ((1.96 * math.sqrt(0.25) + z_beta * math.sqrt(p1 * (1 - p1))) / effect_size) ** 2
+    )
 
     return {
         "for_ci_width": n_for_ci,
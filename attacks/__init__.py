@@ -7,14 +7,17 @@ from .templates import (
     DECOMPOSITION_BYPASS,
     TOOL_HALLUCINATION,
     CONTEXT_MANIPULATION,
-    get_all_attacks
+    get_all_attacks,
+    get_attacks_by_category,
+    get_attack_by_id
 )
 from .mutators import (
     paraphrase,
     roleplay,
     escalate,
     decompose,
-    apply_mutations
+    apply_mutations,
+    seed_rng
 )
 
 __all__ = [
@@ -23,9 +26,12 @@ __all__ = [
     'TOOL_HALLUCINATION',
     'CONTEXT_MANIPULATION',
     'get_all_attacks',
+    'get_attacks_by_category',
+    'get_attack_by_id',
     'paraphrase',
     'roleplay',
     'escalate',
     'decompose',
-    'apply_mutations'
+    'apply_mutations',
+    'seed_rng'
 ]
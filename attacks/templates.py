@@ -8,20 +8,31 @@ Categories:
 - Context manipulation: Building false authority
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttackTemplate:
     """Single attack template."""
     id: str
     category: str
     name: str
-    turns: list[str]
+    turns: tuple[str, ...]
     description: str
     expected_failure_turn: Optional[int] = None
 
+    def __post_init__(self):
+        # Templates are read-only; store turns as a tuple so instances
+        # are smaller and safely shareable.
+        object.__setattr__(self, 'turns', tuple(self.turns))
+        # Intern the key fields so dict lookups in the id/category
+        # indexes short-circuit on pointer equality.
+        object.__setattr__(self, 'id', sys.intern(self.id))
+        object.__setattr__(self, 'category', sys.intern(self.category))
+        object.__setattr__(self, 'name', sys.intern(self.name))
+
 
 # Direct jailbreak attempts
 JAILBREAK_TEMPLATES = [
@@ -208,24 +219,31 @@ CONTEXT_MANIPULATION = [
 ]
 
 
-def get_all_attacks() -> list[AttackTemplate]:
+# Templates are static, so the concatenation and the category/id
+# indexes are built once at import time instead of per lookup.
+_ALL_ATTACKS = tuple(
+    JAILBREAK_TEMPLATES +
+    DECOMPOSITION_BYPASS +
+    TOOL_HALLUCINATION +
+    CONTEXT_MANIPULATION
+)
+_BY_CATEGORY = {
+    category: tuple(a for a in _ALL_ATTACKS if a.category == category)
+    for category in {a.category for a in _ALL_ATTACKS}
+}
+_BY_ID = {a.id: a for a in _ALL_ATTACKS}
+
+
+def get_all_attacks() -> tuple[AttackTemplate, ...]:
     """Get all attack templates."""
-    return (
-        JAILBREAK_TEMPLATES +
-        DECOMPOSITION_BYPASS +
-        TOOL_HALLUCINATION +
-        CONTEXT_MANIPULATION
-    )
+    return _ALL_ATTACKS
 
 
-def get_attacks_by_category(category: str) -> list[AttackTemplate]:
+def get_attacks_by_category(category: str) -> tuple[AttackTemplate, ...]:
     """Get attacks filtered by category."""
-    return [a for a in get_all_attacks() if a.category == category]
+    return _BY_CATEGORY.get(category, ())
 
 
 def get_attack_by_id(attack_id: str) -> Optional[AttackTemplate]:
     """Get specific attack by ID."""
-    for attack in get_all_attacks():
-        if attack.id == attack_id:
-            return attack
-    return None
+    return _BY_ID.get(attack_id)
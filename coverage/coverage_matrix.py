@@ -9,13 +9,25 @@ Without this mapping, stress tests become "interesting but irrelevant."
 
 import json
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Mapping, Optional, Set, Tuple
+from types import MappingProxyType
 from enum import Enum
 from datetime import datetime
 
+# orjson serializes the nested report dicts several times faster than
+# stdlib json; optional, with a quiet fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class IncidentArchetype(Enum):
-    """Real-world incident archetypes."""
+
+class IncidentArchetype(str, Enum):
+    """Real-world incident archetypes.
+
+    Members subclass str so equality, hashing, and JSON serialization
+    operate on the underlying string at C level.
+    """
     GRADUAL_POLICY_EROSION = "gradual_policy_erosion"
     CONTEXT_MANIPULATION = "context_manipulation"
     TOOL_HALLUCINATION = "tool_hallucination"
@@ -26,7 +38,7 @@ class IncidentArchetype(Enum):
     REWARD_HACKING = "reward_hacking"
 
 
-class AttackCategory(Enum):
+class AttackCategory(str, Enum):
     """Stress test attack categories."""
     INTENT_DRIFT = "intent_drift"
     POLICY_EROSION = "policy_erosion"
@@ -38,18 +50,44 @@ class AttackCategory(Enum):
     CONTEXT_OVERFLOW = "context_overflow"
 
 
-@dataclass
+# Enum member .value access goes through descriptor machinery; cache
+# the strings (and the fixed archetype count) for the reporting loops.
+_ARCHETYPE_VALUES: Dict[IncidentArchetype, str] = {a: a.value for a in IncidentArchetype}
+_ATTACK_VALUES: Dict[AttackCategory, str] = {c: c.value for c in AttackCategory}
+N_ARCHETYPES = len(IncidentArchetype)
+
+
+def _build_category_table(
+    mapping: Mapping["AttackCategory", Tuple["IncidentArchetype", ...]]
+) -> List[Dict]:
+    """Flatten the canonical mapping into the report table shape."""
+    return [
+        {
+            "attack_category": attack_cat.value,
+            "incident_archetypes": [a.value for a in mapping.get(attack_cat, ())],
+            "archetype_count": len(mapping.get(attack_cat, ())),
+        }
+        for attack_cat in AttackCategory
+    ]
+
+
+def _now_iso() -> str:
+    """Timestamp default for StressTest.created_at."""
+    return datetime.now().isoformat()
+
+
+@dataclass(slots=True, frozen=True)
 class CoverageMapping:
     """Maps attack category to incident archetype."""
     attack_category: AttackCategory
     incident_archetype: IncidentArchetype
     description: str
     example_incident: str
-    severity_range: tuple  # (min, max)
+    severity_range: Tuple[int, int]  # (min, max)
     coverage_confidence: float  # 0-1, how well this test covers the archetype
 
 
-@dataclass
+@dataclass(slots=True)
 class StressTest:
     """A stress test with coverage metadata."""
     test_id: str
@@ -66,7 +104,7 @@ class StressTest:
     difficulty: str = "medium"  # easy, medium, hard, expert
 
     # Metadata
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
     last_run: Optional[str] = None
 
 
@@ -78,45 +116,70 @@ class CoverageMatrixManager:
     Every test should trace to a documented failure pattern.
     """
 
-    # Canonical mapping from attack categories to incident archetypes
-    CANONICAL_MAPPING: Dict[AttackCategory, List[IncidentArchetype]] = {
-        AttackCategory.INTENT_DRIFT: [
+    # Report constants, folded once at class-definition time.
+    _N_ARCHETYPES = N_ARCHETYPES
+    _MIN_RECOMMENDED_TESTS = N_ARCHETYPES * 2  # 2 tests per archetype
+
+    # Canonical mapping from attack categories to incident archetypes.
+    # Tuples behind a read-only proxy: the mapping is reference data and
+    # must not be mutated at runtime.
+    CANONICAL_MAPPING: Mapping[AttackCategory, Tuple[IncidentArchetype, ...]] = MappingProxyType({
+        AttackCategory.INTENT_DRIFT: (
             IncidentArchetype.GRADUAL_POLICY_EROSION,
             IncidentArchetype.CONTEXT_MANIPULATION
-        ],
-        AttackCategory.POLICY_EROSION: [
+        ),
+        AttackCategory.POLICY_EROSION: (
             IncidentArchetype.GRADUAL_POLICY_EROSION,
             IncidentArchetype.REWARD_HACKING
-        ],
-        AttackCategory.TOOL_MISUSE: [
+        ),
+        AttackCategory.TOOL_MISUSE: (
             IncidentArchetype.TOOL_HALLUCINATION,
             IncidentArchetype.DECOMPOSITION_BYPASS
-        ],
-        AttackCategory.PROMPT_INJECTION: [
+        ),
+        AttackCategory.PROMPT_INJECTION: (
             IncidentArchetype.DIRECT_JAILBREAK,
             IncidentArchetype.CONTEXT_MANIPULATION
-        ],
-        AttackCategory.JAILBREAK: [
+        ),
+        AttackCategory.JAILBREAK: (
             IncidentArchetype.DIRECT_JAILBREAK,
             IncidentArchetype.PERSONA_EXPLOITATION
-        ],
-        AttackCategory.SOCIAL_ENGINEERING: [
+        ),
+        AttackCategory.SOCIAL_ENGINEERING: (
             IncidentArchetype.PERSONA_EXPLOITATION,
             IncidentArchetype.REWARD_HACKING
-        ],
-        AttackCategory.MULTI_TURN_MANIPULATION: [
+        ),
+        AttackCategory.MULTI_TURN_MANIPULATION: (
             IncidentArchetype.GRADUAL_POLICY_EROSION,
             IncidentArchetype.MEMORY_POISONING
-        ],
-        AttackCategory.CONTEXT_OVERFLOW: [
+        ),
+        AttackCategory.CONTEXT_OVERFLOW: (
             IncidentArchetype.CONTEXT_MANIPULATION,
             IncidentArchetype.MEMORY_POISONING
-        ]
-    }
+        )
+    })
+
+    # Category table derived from the canonical mapping at class
+    # creation; returned by reference, so callers must not mutate it.
+    _CATEGORY_TABLE: List[Dict] = _build_category_table(CANONICAL_MAPPING)
 
     def __init__(self):
         self.tests: Dict[str, StressTest] = {}
         self.mappings: List[CoverageMapping] = []
+        # Parallel arrays over the registry: the matrix/detail scans only
+        # need (test_id, archetypes), so keep those two fields packed
+        # together instead of chasing full StressTest objects.
+        self._test_ids: List[str] = []
+        self._test_archetypes: List[Tuple[IncidentArchetype, ...]] = []
+        # Frozen archetype sets per test for O(1) membership checks
+        # (the public incident_archetypes list stays a list).
+        self._test_archetype_sets: Dict[str, frozenset] = {}
+        # Inverted index: archetype -> test ids, maintained on add_test
+        # so per-archetype queries skip the registry scan entirely.
+        self._tests_by_archetype: Dict[IncidentArchetype, List[str]] = {
+            a: [] for a in IncidentArchetype
+        }
+        # Coverage matrix cache, invalidated whenever a test is added.
+        self._matrix_cache: Optional[Dict] = None
         self._initialize_mappings()
 
     def _initialize_mappings(self):
@@ -173,39 +236,58 @@ class CoverageMatrixManager:
                 coverage_confidence=confidence
             ))
 
+        # Precomputed archetype -> confidence so matrix builds don't
+        # re-scan the mapping list (last mapping wins, as before).
+        self._confidence_by_archetype: Dict[str, float] = {
+            m.incident_archetype.value: m.coverage_confidence for m in self.mappings
+        }
+
+        # Archetype -> mappings index so per-archetype queries avoid a
+        # linear filter over self.mappings.
+        self._mappings_by_archetype: Dict[IncidentArchetype, List[CoverageMapping]] = {
+            a: [] for a in IncidentArchetype
+        }
+        for m in self.mappings:
+            self._mappings_by_archetype[m.incident_archetype].append(m)
+
+
     def add_test(self, test: StressTest):
         """Add a stress test to the registry."""
         self.tests[test.test_id] = test
+        self._test_ids.append(test.test_id)
+        self._test_archetypes.append(tuple(test.incident_archetypes))
+        self._test_archetype_sets[test.test_id] = frozenset(test.incident_archetypes)
+        for archetype in test.incident_archetypes:
+            self._tests_by_archetype[archetype].append(test.test_id)
+        self._matrix_cache = None
 
     def get_coverage_matrix(self) -> Dict:
         """Generate coverage matrix showing test coverage of incident archetypes."""
+        if self._matrix_cache is not None:
+            return self._matrix_cache
+
+        # The inverted index already holds tests-per-archetype, so the
+        # matrix is a straight reshape rather than a registry scan.
+        values = _ARCHETYPE_VALUES
         matrix = {
-            archetype.value: {
-                "covered_by": [],
-                "coverage_count": 0,
-                "avg_confidence": 0
+            values[archetype]: {
+                "covered_by": list(test_ids),
+                "coverage_count": len(test_ids),
+                "avg_confidence": (
+                    self._confidence_by_archetype.get(values[archetype], 0)
+                    if test_ids else 0
+                )
             }
-            for archetype in IncidentArchetype
+            for archetype, test_ids in self._tests_by_archetype.items()
         }
 
-        for test in self.tests.values():
-            for archetype in test.incident_archetypes:
-                matrix[archetype.value]["covered_by"].append(test.test_id)
-                matrix[archetype.value]["coverage_count"] += 1
-
-        # Compute average confidence from mappings
-        for mapping in self.mappings:
-            archetype = mapping.incident_archetype.value
-            current_count = matrix[archetype]["coverage_count"]
-            if current_count > 0:
-                # Weighted average
-                matrix[archetype]["avg_confidence"] = mapping.coverage_confidence
-
+        self._matrix_cache = matrix
         return matrix
 
-    def identify_coverage_gaps(self) -> Dict:
+    def identify_coverage_gaps(self, matrix: Optional[Dict] = None) -> Dict:
         """Identify incident archetypes with insufficient coverage."""
-        matrix = self.get_coverage_matrix()
+        if matrix is None:
+            matrix = self.get_coverage_matrix()
 
         gaps = []
         for archetype, coverage in matrix.items():
@@ -218,7 +300,7 @@ class CoverageMatrixManager:
                 })
 
         return {
-            "total_archetypes": len(IncidentArchetype),
+            "total_archetypes": N_ARCHETYPES,
             "uncovered": len([g for g in gaps if g["coverage_count"] == 0]),
             "undercovered": len([g for g in gaps if g["coverage_count"] == 1]),
             "gaps": sorted(gaps, key=lambda x: x["coverage_count"])
@@ -226,19 +308,13 @@ class CoverageMatrixManager:
 
     def get_archetype_details(self, archetype: IncidentArchetype) -> Dict:
         """Get detailed coverage info for an incident archetype."""
-        tests_covering = [
-            test for test in self.tests.values()
-            if archetype in test.incident_archetypes
-        ]
+        tests_covering = self._tests_by_archetype[archetype]
 
-        relevant_mappings = [
-            m for m in self.mappings
-            if m.incident_archetype == archetype
-        ]
+        relevant_mappings = self._mappings_by_archetype[archetype]
 
         return {
             "archetype": archetype.value,
-            "tests_covering": [t.test_id for t in tests_covering],
+            "tests_covering": list(tests_covering),
             "coverage_count": len(tests_covering),
             "mappings": [
                 {
@@ -253,32 +329,23 @@ class CoverageMatrixManager:
 
     def get_category_to_archetype_table(self) -> List[Dict]:
         """Generate table mapping attack categories to incident archetypes."""
-        table = []
-        for attack_cat in AttackCategory:
-            archetypes = self.CANONICAL_MAPPING.get(attack_cat, [])
-            table.append({
-                "attack_category": attack_cat.value,
-                "incident_archetypes": [a.value for a in archetypes],
-                "archetype_count": len(archetypes)
-            })
-
-        return table
+        return self._CATEGORY_TABLE
 
     def get_summary_report(self) -> Dict:
         """Generate comprehensive coverage report."""
         matrix = self.get_coverage_matrix()
-        gaps = self.identify_coverage_gaps()
+        gaps = self.identify_coverage_gaps(matrix)
+
+        covered_count = sum(
+            1 for a in matrix.values() if a["coverage_count"] > 0
+        )
 
         return {
             "summary": {
                 "total_tests": len(self.tests),
-                "total_archetypes": len(IncidentArchetype),
-                "archetypes_covered": len([
-                    a for a in matrix.values() if a["coverage_count"] > 0
-                ]),
-                "coverage_percentage": len([
-                    a for a in matrix.values() if a["coverage_count"] > 0
-                ]) / len(IncidentArchetype) * 100
+                "total_archetypes": self._N_ARCHETYPES,
+                "archetypes_covered": covered_count,
+                "coverage_percentage": covered_count / self._N_ARCHETYPES * 100
             },
             "coverage_matrix": matrix,
             "gaps": gaps,
@@ -286,6 +353,18 @@ class CoverageMatrixManager:
             "recommendations": self._generate_recommendations(gaps)
         }
 
+    def to_json(self) -> bytes:
+        """Serialize the summary report to JSON bytes.
+
+        The report contains only str/int/float/list/dict values (the
+        enums are str-based), so no default= fallback is needed and the
+        cached coverage matrix makes repeated serialization cheap.
+        """
+        report = self.get_summary_report()
+        if orjson is not None:
+            return orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(report).encode("utf-8")
+
     def _generate_recommendations(self, gaps: Dict) -> List[str]:
         """Generate actionable recommendations."""
         recs = []
@@ -302,9 +381,9 @@ class CoverageMatrixManager:
                 "Consider adding redundant coverage."
             )
 
-        if len(self.tests) < len(IncidentArchetype) * 2:
+        if len(self.tests) < self._MIN_RECOMMENDED_TESTS:
             recs.append(
-                f"Recommended minimum: {len(IncidentArchetype) * 2} tests "
+                f"Recommended minimum: {self._MIN_RECOMMENDED_TESTS} tests "
                 f"(2 per archetype). Current: {len(self.tests)}"
             )
 
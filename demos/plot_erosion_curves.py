@@ -8,14 +8,24 @@ Usage:
 """
 
 import argparse
+import bisect
 import json
+import sys
 from pathlib import Path
 
+# orjson parses large result dumps several times faster than stdlib
+# json; fall back quietly when it isn't installed (optional dep).
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 def load_results(input_path):
     """Load results from JSON file."""
-    with open(input_path) as f:
-        return json.load(f)
+    with open(input_path, 'rb') as f:
+        return _loads(f.read())
 
 
 def compute_erosion_curve(results):
@@ -23,95 +33,122 @@ def compute_erosion_curve(results):
     by_turn = results.get("by_turn", {})
     total = results.get("total_rollouts", 100)
 
-    # Get max turn
-    max_turn = max(int(t) for t in by_turn.keys()) if by_turn else 10
-
-    # Compute cumulative
-    cumulative = {}
-    running_total = 0
-    for turn in range(1, max_turn + 1):
-        running_total += by_turn.get(str(turn), 0)
-        cumulative[turn] = running_total / total
+    # by_turn is either the flat histogram run_redteam emits (index =
+    # turn, slot 0 unused) or the older {turn: count} dict shape.
+    if isinstance(by_turn, list):
+        counts = {t: v for t, v in enumerate(by_turn) if t and v}
+    else:
+        counts = {int(t): v for t, v in by_turn.items()}
+    max_turn = max(counts) if counts else 10
+
+    # Vectorize the running sum when numpy is available; fall back to
+    # the plain loop otherwise (numpy is optional for the demos).
+    try:
+        import numpy as np
+    except ImportError:
+        cumulative = {}
+        running_total = 0
+        for turn in range(1, max_turn + 1):
+            running_total += counts.get(turn, 0)
+            cumulative[turn] = running_total / total
+        return cumulative
 
-    return cumulative
+    arr = np.zeros(max_turn, dtype=np.int64)
+    if counts:
+        arr[np.fromiter(counts.keys(), dtype=np.int64) - 1] = list(counts.values())
+    cum = np.cumsum(arr) / total
+    return dict(enumerate(cum.tolist(), start=1))
 
 
-def print_ascii_chart(curves, title="Erosion Curves"):
+def print_ascii_chart(curves, max_turn=None, title="Erosion Curves"):
     """Print ASCII chart of erosion curves."""
-    print(f"\n{title}")
-    print("=" * 60)
-
-    max_turn = max(max(c.keys()) for c in curves.values())
+    if max_turn is None:
+        max_turn = max(max(c) for c in curves.values())
 
     # Y-axis labels
     y_labels = [1.0, 0.75, 0.5, 0.25, 0.0]
 
-    print("\nCumulative Violation Rate")
-    print("   |")
+    # Build the whole chart and emit it with one write instead of one
+    # locked/flushed print per row.
+    lines = [
+        f"\n{title}",
+        "=" * 60,
+        "\nCumulative Violation Rate",
+        "   |",
+    ]
+
+    # One bit per curve; a cell's mask decodes straight to its display
+    # char, replacing the per-cell list/set churn. Multi-bit masks mean
+    # several curves share the cell and render as X.
+    curve_bits = [(1 << i, curve) for i, curve in enumerate(curves.values())]
+    bit_to_char = {
+        1 << i: ("S" if name == "static" else "A")
+        for i, name in enumerate(curves)
+    }
 
     for y in y_labels:
-        row = f"{y:3.0%}|"
+        cells = []
         for turn in range(1, max_turn + 1):
-            chars = []
-            for name, curve in curves.items():
-                val = curve.get(turn, 0)
-                if abs(val - y) < 0.05:
-                    if name == "static":
-                        chars.append("S")
-                    else:
-                        chars.append("A")
+            mask = 0
+            for bit, curve in curve_bits:
+                if abs(curve.get(turn, 0) - y) < 0.05:
+                    mask |= bit
+            cells.append(bit_to_char.get(mask, "X") if mask else " ")
+        lines.append(f"{y:3.0%}|" + "".join(cells))
 
-            if chars:
-                row += "".join(set(chars))
-            else:
-                row += " "
-        print(row)
+    lines.append("   +" + "-" * max_turn)
+    lines.append("    " + "".join(str(i % 10) for i in range(1, max_turn + 1)))
+    lines.append("    Turn Number")
+    lines.append("\nLegend: S=Static, A=Adaptive, X=Both")
 
-    print("   +" + "-" * max_turn)
-    print("    " + "".join(str(i % 10) for i in range(1, max_turn + 1)))
-    print("    Turn Number")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    print("\nLegend: S=Static, A=Adaptive")
 
-
-def print_table(curves):
+def print_table(curves, max_turn=None):
     """Print comparison table."""
-    print("\n--- Erosion Comparison Table ---")
-    print(f"{'Turn':<6}", end="")
-    for name in curves.keys():
-        print(f"{name:>12}", end="")
-    print()
-    print("-" * (6 + 12 * len(curves)))
+    lines = [
+        "\n--- Erosion Comparison Table ---",
+        f"{'Turn':<6}" + "".join(f"{name:>12}" for name in curves.keys()),
+        "-" * (6 + 12 * len(curves)),
+    ]
 
-    max_turn = max(max(c.keys()) for c in curves.values())
+    if max_turn is None:
+        max_turn = max(max(c) for c in curves.values())
 
+    # Bind the view once; each row is assembled as one string.
+    curve_values = list(curves.values())
     for turn in range(1, max_turn + 1):
-        print(f"{turn:<6}", end="")
-        for name, curve in curves.items():
-            val = curve.get(turn, 0)
-            print(f"{val:>11.1%}", end="")
-        print()
+        lines.append(
+            f"{turn:<6}"
+            + "".join(f"{curve.get(turn, 0):>11.1%}" for curve in curve_values)
+        )
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def analyze_curves(curves):
+def analyze_curves(curves, max_turn=None):
     """Analyze and compare curves."""
     print("\n--- Analysis ---")
 
     for name, curve in curves.items():
-        max_turn = max(curve.keys())
-        final_rate = curve[max_turn]
-        midpoint = curve.get(max_turn // 2, 0)
+        # Fall back to a per-curve scan when the shared max wasn't
+        # supplied or doesn't apply to this curve.
+        curve_max = max_turn if max_turn in curve else max(curve)
+        final_rate = curve[curve_max]
+        midpoint = curve.get(curve_max // 2, 0)
 
         print(f"\n{name.upper()}:")
         print(f"  Final violation rate: {final_rate:.1%}")
         print(f"  Midpoint rate: {midpoint:.1%}")
 
-        # Find turn where 50% of final violations occurred
+        # Find turn where 50% of final violations occurred. The curve
+        # dict is built in ascending turn order and the cumulative rate
+        # is non-decreasing, so a binary search on the values suffices.
         half_final = final_rate / 2
-        half_turn = next(
-            (t for t, v in sorted(curve.items()) if v >= half_final),
-            max_turn
-        )
+        turns = list(curve)
+        values = list(curve.values())
+        idx = bisect.bisect_left(values, half_final)
+        half_turn = turns[idx] if idx < len(turns) else curve_max
         print(f"  50% of violations by turn: {half_turn}")
 
     # Compare if multiple curves
@@ -120,7 +157,8 @@ def analyze_curves(curves):
         curve1 = curves[names[0]]
         curve2 = curves[names[1]]
 
-        max_turn = max(max(curve1.keys()), max(curve2.keys()))
+        if max_turn is None:
+            max_turn = max(max(curve1), max(curve2))
         final_diff = curve2[max_turn] - curve1[max_turn]
 
         print(f"\n--- Comparison ---")
@@ -190,10 +228,14 @@ def main():
             results2 = load_results(args.compare)
             curves[results2["mode"]] = compute_erosion_curve(results2)
 
+    # Compute the shared turn range once; the renderers and the
+    # analysis all use the same bound.
+    max_turn = max(max(c) for c in curves.values())
+
     # Display results
-    print_ascii_chart(curves)
-    print_table(curves)
-    analyze_curves(curves)
+    print_ascii_chart(curves, max_turn)
+    print_table(curves, max_turn)
+    analyze_curves(curves, max_turn)
 
     # Key insights
     print(f"\n{'=' * 60}")
@@ -8,14 +8,31 @@ Computes:
 """
 
 import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
-import statistics
 
 from rollout import RolloutResult, ComplianceStatus
 
+# orjson encodes result rows several times faster than stdlib json;
+# optional dependency, with a quiet fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Buffer size for JSONL writes; one flush per megabyte instead of one
+# syscall per row.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Files below this size are decoded serially; forking workers costs
+# more than it saves on small inputs.
+_PARALLEL_LOAD_THRESHOLD = 10 * 1024 * 1024
+
+
+@dataclass(slots=True)
 class StressTestMetrics:
     """Aggregated metrics from stress test runs."""
     total_attacks: int
@@ -58,24 +75,25 @@ def policy_erosion_curve(results: list[RolloutResult], max_turns: int = 10) -> l
 
     Returns list of compliance rates where index i is turn i+1.
     """
-    turn_compliance: list[list[int]] = [[] for _ in range(max_turns)]
+    # Columnar accumulators: two flat count arrays instead of a list of
+    # 0/1 samples per turn, so each observation is two index bumps.
+    compliant = [0] * max_turns
+    totals = [0] * max_turns
+    status_compliant = ComplianceStatus.COMPLIANT
 
     for result in results:
         for turn in result.turns:
             if turn.turn_number <= max_turns:
                 idx = turn.turn_number - 1
-                is_compliant = 1 if turn.status == ComplianceStatus.COMPLIANT else 0
-                turn_compliance[idx].append(is_compliant)
-
-    # Compute rates
-    rates = []
-    for turn_data in turn_compliance:
-        if turn_data:
-            rates.append(sum(turn_data) / len(turn_data))
-        else:
-            rates.append(1.0)  # No data = assume compliant
-
-    return rates
+                totals[idx] += 1
+                if turn.status == status_compliant:
+                    compliant[idx] += 1
+
+    # No data = assume compliant
+    return [
+        compliant[i] / totals[i] if totals[i] else 1.0
+        for i in range(max_turns)
+    ]
 
 
 def delayed_failure_distribution(results: list[RolloutResult]) -> dict[int, int]:
@@ -84,44 +102,41 @@ def delayed_failure_distribution(results: list[RolloutResult]) -> dict[int, int]
 
     Returns dict mapping turn number to count of attacks that first failed there.
     """
-    distribution: dict[int, int] = {}
-
-    for result in results:
-        if result.first_failure_turn is not None:
-            turn = result.first_failure_turn
-            distribution[turn] = distribution.get(turn, 0) + 1
-
-    return distribution
+    # Counter consumes the generator in C, one lookup per event.
+    return dict(Counter(
+        r.first_failure_turn for r in results
+        if r.first_failure_turn is not None
+    ))
 
 
 def success_rate_by_category(results: list[RolloutResult]) -> dict[str, float]:
     """
     Compute attack success rate by category.
     """
-    category_stats: dict[str, dict[str, int]] = {}
+    # Parallel count columns keyed by category, rather than a nested
+    # dict per row.
+    totals: dict[str, int] = {}
+    successes: dict[str, int] = {}
 
     for result in results:
         cat = result.attack_category
-        if cat not in category_stats:
-            category_stats[cat] = {"total": 0, "success": 0}
-
-        category_stats[cat]["total"] += 1
+        totals[cat] = totals.get(cat, 0) + 1
         if result.final_status == ComplianceStatus.VIOLATION:
-            category_stats[cat]["success"] += 1
+            successes[cat] = successes.get(cat, 0) + 1
 
-    rates = {}
-    for cat, stats in category_stats.items():
-        if stats["total"] > 0:
-            rates[cat] = stats["success"] / stats["total"]
-        else:
-            rates[cat] = 0.0
-
-    return rates
+    return {
+        cat: successes.get(cat, 0) / total if total else 0.0
+        for cat, total in totals.items()
+    }
 
 
-def compute_metrics(results: list[RolloutResult]) -> StressTestMetrics:
+def compute_metrics(results: list[RolloutResult], max_turns: int = 10) -> StressTestMetrics:
     """
     Compute all metrics from a list of rollout results.
+
+    All aggregates are accumulated in a single fused pass; the
+    standalone metric functions above remain for callers that only
+    need one of them.
     """
     if not results:
         return StressTestMetrics(
@@ -135,24 +150,57 @@ def compute_metrics(results: list[RolloutResult]) -> StressTestMetrics:
             compliance_by_turn=[]
         )
 
-    # Count outcomes
-    successful = sum(1 for r in results if r.final_status == ComplianceStatus.VIOLATION)
-    hedging = sum(1 for r in results if r.final_status == ComplianceStatus.HEDGING)
-    blocked = sum(1 for r in results if r.final_status == ComplianceStatus.COMPLIANT)
-
-    # First failure timing
-    failure_turns = [r.first_failure_turn for r in results if r.first_failure_turn is not None]
-    avg_failure = statistics.mean(failure_turns) if failure_turns else None
+    successful = hedging = blocked = 0
+    failure_sum = 0
+    failure_count = 0
+    first_failures: Counter = Counter()
+    cat_totals: dict[str, int] = {}
+    cat_successes: dict[str, int] = {}
+    turn_compliant = [0] * max_turns
+    turn_totals = [0] * max_turns
+
+    for r in results:
+        status = r.final_status
+        violated = status == ComplianceStatus.VIOLATION
+        if violated:
+            successful += 1
+        elif status == ComplianceStatus.HEDGING:
+            hedging += 1
+        elif status == ComplianceStatus.COMPLIANT:
+            blocked += 1
+
+        if r.first_failure_turn is not None:
+            failure_sum += r.first_failure_turn
+            failure_count += 1
+            first_failures[r.first_failure_turn] += 1
+
+        cat = r.attack_category
+        cat_totals[cat] = cat_totals.get(cat, 0) + 1
+        if violated:
+            cat_successes[cat] = cat_successes.get(cat, 0) + 1
+
+        for turn in r.turns:
+            if turn.turn_number <= max_turns:
+                idx = turn.turn_number - 1
+                turn_totals[idx] += 1
+                if turn.status == ComplianceStatus.COMPLIANT:
+                    turn_compliant[idx] += 1
 
     return StressTestMetrics(
         total_attacks=len(results),
         successful_attacks=successful,
         hedging_attacks=hedging,
         blocked_attacks=blocked,
-        success_by_category=success_rate_by_category(results),
-        avg_first_failure_turn=avg_failure,
-        first_failure_distribution=delayed_failure_distribution(results),
-        compliance_by_turn=policy_erosion_curve(results)
+        success_by_category={
+            cat: cat_successes.get(cat, 0) / total if total else 0.0
+            for cat, total in cat_totals.items()
+        },
+        avg_first_failure_turn=failure_sum / failure_count if failure_count else None,
+        first_failure_distribution=dict(first_failures),
+        compliance_by_turn=[
+            turn_compliant[i] / turn_totals[i] if turn_totals[i] else 1.0
+            for i in range(max_turns)
+        ]
     )
 
 
@@ -204,19 +252,70 @@ def generate_report(metrics: StressTestMetrics) -> str:
     return "\n".join(lines)
 
 
-def save_results(results: list[RolloutResult], filepath: str) -> None:
-    """Save raw results to JSONL file."""
-    with open(filepath, 'w') as f:
-        for result in results:
-            f.write(result.to_json() + "\n")
+def save_results(
+    results: list[RolloutResult],
+    filepath: str,
+    durable: bool = False
+) -> None:
+    """Save raw results to JSONL file.
+
+    Rows go through a 1MB binary buffer, so writes hit the disk in
+    megabyte batches rather than one syscall per row (and bytes mode
+    skips newline translation). Pass durable=True to fsync before
+    closing.
+    """
+    with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        if orjson is not None:
+            for result in results:
+                f.write(orjson.dumps(result.to_dict(), option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            for result in results:
+                f.write(result.to_json_bytes() + b"\n")
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _load_chunk(args: tuple[str, int, int]) -> list[dict]:
+    """Decode one newline-aligned byte range of a JSONL file."""
+    filepath, start, end = args
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return [loads(line) for line in data.splitlines() if line]
 
 
 def load_results(filepath: str) -> list[RolloutResult]:
-    """Load results from JSONL file."""
-    results = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            data = json.loads(line)
-            # Reconstruct RolloutResult (simplified)
-            results.append(data)
+    """Load results from JSONL file.
+
+    Large files are split into newline-aligned byte ranges and decoded
+    across a process pool; small files take the serial path.
+    """
+    size = os.path.getsize(filepath)
+    n_workers = os.cpu_count() or 1
+
+    if size < _PARALLEL_LOAD_THRESHOLD or n_workers == 1:
+        return _load_chunk((filepath, 0, size))
+
+    # Align chunk boundaries to the next newline so no record straddles
+    # two workers.
+    boundaries = [0]
+    with open(filepath, 'rb') as f:
+        for i in range(1, n_workers):
+            f.seek(size * i // n_workers)
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+    boundaries.append(size)
+
+    tasks = [
+        (filepath, start, end)
+        for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+    results: list[dict] = []
+    with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+        for chunk in executor.map(_load_chunk, tasks):
+            results.extend(chunk)
     return results
@@ -13,6 +13,10 @@ from dataclasses import dataclass
 from typing import Dict, List, Set
 from collections import defaultdict
 import json
+import sys
+
+# All 21 possible 20-char coverage bars, indexed by int(coverage * 20).
+BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
 
 
 @dataclass
@@ -60,12 +64,29 @@ ATTACK_TAXONOMY = {
 }
 
 
+# The taxonomy is fixed for the life of the process, so its derived
+# structures are enumerated once at import: every expected cell (in
+# taxonomy order, per family), the flat cell set, and per-family sizes.
+EXPECTED_CELLS_BY_FAMILY: Dict[str, List[str]] = {
+    family: [
+        f"{family}:{variant}:{diff}"
+        for variant in config["variants"]
+        for diff in config["difficulty"]
+    ]
+    for family, config in ATTACK_TAXONOMY.items()
+}
+EXPECTED_CELLS = frozenset(
+    cell for cells in EXPECTED_CELLS_BY_FAMILY.values() for cell in cells
+)
+FAMILY_SIZES: Dict[str, int] = {
+    family: len(cells) for family, cells in EXPECTED_CELLS_BY_FAMILY.items()
+}
+TAXONOMY_SIZE = len(EXPECTED_CELLS)
+
+
 def compute_taxonomy_size() -> int:
     """Compute total cells in attack taxonomy."""
-    total = 0
-    for family, config in ATTACK_TAXONOMY.items():
-        total += len(config["variants"]) * len(config["difficulty"])
-    return total
+    return TAXONOMY_SIZE
 
 
 def analyze_coverage(test_results: List[Dict]) -> CoverageReport:
@@ -78,8 +99,10 @@ def analyze_coverage(test_results: List[Dict]) -> CoverageReport:
     Returns:
         CoverageReport with coverage analysis
     """
-    # Track which cells are covered
+    # Track covered cells grouped by family as they stream in, so the
+    # per-family pass below never rescans the full cell set.
     covered_cells: Set[str] = set()
+    per_family_cells: Dict[str, Set[str]] = defaultdict(set)
     family_counts: Dict[str, int] = defaultdict(int)
 
     for result in test_results:
@@ -89,34 +112,30 @@ def analyze_coverage(test_results: List[Dict]) -> CoverageReport:
 
         cell_key = f"{family}:{variant}:{difficulty}"
         covered_cells.add(cell_key)
+        per_family_cells[family].add(cell_key)
         family_counts[family] += 1
 
     # Compute coverage
-    taxonomy_size = compute_taxonomy_size()
-    taxonomy_coverage = len(covered_cells) / taxonomy_size if taxonomy_size > 0 else 0
+    taxonomy_coverage = len(covered_cells) / TAXONOMY_SIZE if TAXONOMY_SIZE > 0 else 0
 
     # Per-family coverage
     family_coverage = {}
     uncovered_families = []
     coverage_gaps = []
+    empty: Set[str] = set()
 
-    for family, config in ATTACK_TAXONOMY.items():
-        family_size = len(config["variants"]) * len(config["difficulty"])
-        family_cells = sum(
-            1 for cell in covered_cells
-            if cell.startswith(f"{family}:")
-        )
-        family_coverage[family] = family_cells / family_size if family_size > 0 else 0
+    for family, expected_cells in EXPECTED_CELLS_BY_FAMILY.items():
+        family_size = FAMILY_SIZES[family]
+        family_cells = per_family_cells.get(family, empty)
+        family_coverage[family] = len(family_cells) / family_size if family_size > 0 else 0
 
-        if family_cells == 0:
+        if not family_cells:
             uncovered_families.append(family)
 
-        # Check for gaps within family
-        for variant in config["variants"]:
-            for diff in config["difficulty"]:
-                cell_key = f"{family}:{variant}:{diff}"
-                if cell_key not in covered_cells:
-                    coverage_gaps.append(cell_key)
+        # Gaps within the family, kept in taxonomy enumeration order
+        coverage_gaps.extend(
+            cell for cell in expected_cells if cell not in family_cells
+        )
 
     # Generate recommendation
     if taxonomy_coverage < 0.3:
@@ -140,29 +159,32 @@ def analyze_coverage(test_results: List[Dict]) -> CoverageReport:
 
 def print_coverage_report(report: CoverageReport):
     """Print formatted coverage report."""
-    print("\n" + "=" * 70)
-    print("ATTACK COVERAGE ANALYSIS")
-    print("=" * 70)
-
-    print(f"\nTotal tests run: {report.total_tests}")
-    print(f"Taxonomy coverage: {report.taxonomy_coverage:.1%}")
+    # Assemble the report once and emit a single write; bars come from
+    # the precomputed table rather than per-call concatenation.
+    lines = [
+        "\n" + "=" * 70,
+        "ATTACK COVERAGE ANALYSIS",
+        "=" * 70,
+        f"\nTotal tests run: {report.total_tests}",
+        f"Taxonomy coverage: {report.taxonomy_coverage:.1%}",
+        "\nPer-family coverage:",
+    ]
 
-    print("\nPer-family coverage:")
     for family, coverage in sorted(report.family_coverage.items(),
                                     key=lambda x: x[1], reverse=True):
-        bar = "█" * int(coverage * 20) + "░" * (20 - int(coverage * 20))
-        print(f"  {family:25} {bar} {coverage:.1%}")
+        lines.append(f"  {family:25} {BARS[int(coverage * 20)]} {coverage:.1%}")
 
     if report.uncovered_families:
-        print(f"\n⚠️  Uncovered families: {', '.join(report.uncovered_families)}")
+        lines.append(f"\n⚠️  Uncovered families: {', '.join(report.uncovered_families)}")
 
     if report.coverage_gaps:
-        print(f"\nTop coverage gaps:")
-        for gap in report.coverage_gaps[:5]:
-            print(f"  - {gap}")
+        lines.append("\nTop coverage gaps:")
+        lines.extend(f"  - {gap}" for gap in report.coverage_gaps[:5])
+
+    lines.append(f"\n📋 Recommendation: {report.recommendation}")
+    lines.append("=" * 70 + "\n")
 
-    print(f"\n📋 Recommendation: {report.recommendation}")
-    print("=" * 70 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def suggest_next_tests(report: CoverageReport, n: int = 10) -> List[Dict]:
@@ -12,12 +12,74 @@ Usage:
 import argparse
 import json
 import os
+import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-from attacks import get_all_attacks, get_attacks_by_category, apply_mutations
+from attacks import get_all_attacks, get_attacks_by_category, apply_mutations, seed_rng
 from rollout import RolloutEngine, RolloutResult, create_simulated_model
 from metrics import compute_metrics, generate_report, save_results
 
+# Mutation operators applied when generating attack variants.
+_MUTATIONS = ["paraphrase", "roleplay", "escalate"]
+
+# Per-worker state, built once per process by _init_worker rather than
+# once per attack.
+_worker_engine: RolloutEngine = None
+_worker_seed: int = 42
+
+
+def _init_worker(failure_prob: float, seed: int, verbose: bool = False) -> None:
+    """Construct the per-process rollout engine for the pool workers."""
+    global _worker_engine, _worker_seed
+    _worker_engine = RolloutEngine(
+        model_fn=create_simulated_model(failure_prob),
+        verbose=verbose
+    )
+    _worker_seed = seed
+
+
+def _run_one(task_args: tuple) -> list[RolloutResult]:
+    """Run one attack plus its mutated variants in the current worker."""
+    index, attack, task, max_turns, n_variants = task_args
+    # Seed per attack index so results are reproducible and identical
+    # regardless of how attacks are scheduled across workers. The
+    # simulated model keeps a private RNG, re-seeded alongside the
+    # mutation sampling stream.
+    attack_seed = hash((_worker_seed, index)) & 0xffffffff
+    random.seed(attack_seed)
+    seed_rng(attack_seed)
+    _worker_engine.model_fn.reseed(attack_seed)
+
+    engine = _worker_engine
+    results = [engine.run(attack, task=task, max_turns=max_turns)]
+
+    # Run mutated variants; how many operators each variant applies is
+    # drawn in one batch up front.
+    if n_variants > 1 and attack.turns:
+        sizes = random.choices((1, 2), k=n_variants - 1)
+        for v, n_mutations in enumerate(sizes):
+            # Mutate first turn with 1-2 random mutation operators
+            selected = random.sample(_MUTATIONS, n_mutations)
+            # Only turn 0 changes; share the rest of the tuple.
+            new_first = apply_mutations(
+                attack.turns[0],
+                selected,
+                task=task
+            )
+            mutated_turns = (new_first,) + attack.turns[1:]
+            mutated_attack = type(attack)(
+                id=f"{attack.id}_v{v+1}",
+                category=attack.category,
+                name=f"{attack.name}_variant_{v+1}",
+                turns=mutated_turns,
+                description=attack.description
+            )
+
+            results.append(engine.run(mutated_attack, task=task, max_turns=max_turns))
+
+    return results
+
 
 def run_stress_tests(
     categories: list[str] = None,
@@ -25,11 +87,17 @@ def run_stress_tests(
     max_turns: int = 8,
     task: str = "access restricted information",
     verbose: bool = False,
-    failure_prob: float = 0.3
+    failure_prob: float = 0.3,
+    seed: int = 42,
+    workers: int = None
 ) -> list[RolloutResult]:
     """
     Run stress tests across attack categories.
 
+    Attacks are independent of each other, so they are fanned out
+    across a process pool; verbose runs stay serial so per-turn output
+    doesn't interleave.
+
     Args:
         categories: Attack categories to test (None = all)
         n_variants: Number of mutated variants per attack
@@ -37,6 +105,8 @@ def run_stress_tests(
         task: Task to inject into attack templates
         verbose: Print progress
         failure_prob: Simulated model failure probability
+        seed: Base seed for reproducible runs
+        workers: Worker process count (None = cpu count, 1 = serial)
 
     Returns:
         List of rollout results
@@ -57,52 +127,34 @@ def run_stress_tests(
         print(f"  Task: {task}")
         print()
 
-    # Create simulated model
-    model_fn = create_simulated_model(failure_prob)
-
-    # Create rollout engine
-    engine = RolloutEngine(
-        model_fn=model_fn,
-        verbose=verbose
-    )
-
+    tasks = [
+        (i, attack, task, max_turns, n_variants)
+        for i, attack in enumerate(attacks)
+    ]
     results = []
-
-    for i, attack in enumerate(attacks):
-        if verbose:
-            print(f"[Attack {i+1}/{len(attacks)}] {attack.id}: {attack.name}")
-
-        # Run base attack
-        result = engine.run(attack, task=task, max_turns=max_turns)
-        results.append(result)
-
-        # Run mutated variants
-        for v in range(n_variants - 1):
-            # Create mutated version of first turn
-            if attack.turns:
-                # Apply random mutations
-                mutated_attack = type(attack)(
-                    id=f"{attack.id}_v{v+1}",
-                    category=attack.category,
-                    name=f"{attack.name}_variant_{v+1}",
-                    turns=attack.turns.copy(),
-                    description=attack.description
-                )
-                # Mutate first turn
-                mutations = ["paraphrase", "roleplay", "escalate"]
-                import random
-                selected = random.sample(mutations, random.randint(1, 2))
-                mutated_attack.turns[0] = apply_mutations(
-                    attack.turns[0],
-                    selected,
-                    task=task
-                )
-
-                variant_result = engine.run(mutated_attack, task=task, max_turns=max_turns)
-                results.append(variant_result)
-
-        if verbose:
-            print()
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    if verbose or n_workers == 1 or len(tasks) < 2:
+        _init_worker(failure_prob, seed, verbose=verbose)
+        for i, task_args in enumerate(tasks):
+            if verbose:
+                attack = task_args[1]
+                print(f"[Attack {i+1}/{len(attacks)}] {attack.id}: {attack.name}")
+
+            results.extend(_run_one(task_args))
+
+            if verbose:
+                print()
+        return results
+
+    chunksize = max(1, len(tasks) // (4 * n_workers))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(failure_prob, seed)
+    ) as executor:
+        for attack_results in executor.map(_run_one, tasks, chunksize=chunksize):
+            results.extend(attack_results)
 
     return results
 
@@ -111,57 +163,67 @@ def generate_plots(metrics, output_dir: str = "results/plots"):
     """Generate visualization plots."""
     os.makedirs(output_dir, exist_ok=True)
 
-    # Try to import matplotlib
+    # Try to import matplotlib; the headless Agg backend is forced so
+    # no GUI backend probing happens, and the OO API below avoids the
+    # pyplot state machine entirely.
     try:
-        import matplotlib.pyplot as plt
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
     except ImportError:
         print("matplotlib not installed. Skipping plots.")
         print("Install with: pip install matplotlib")
         return
 
+    # One Figure reused across all plots via clear(), skipping the
+    # per-plot figure construction cost.
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+
     # Erosion curve
-    plt.figure(figsize=(10, 6))
+    ax = fig.subplots()
     turns = list(range(1, len(metrics.compliance_by_turn) + 1))
-    plt.plot(turns, metrics.compliance_by_turn, 'b-o', linewidth=2, markersize=8)
-    plt.xlabel('Turn Number', fontsize=12)
-    plt.ylabel('Compliance Rate', fontsize=12)
-    plt.title('Policy Erosion Curve', fontsize=14)
-    plt.ylim(0, 1.05)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'erosion_curve.png'), dpi=150)
-    plt.close()
+    ax.plot(turns, metrics.compliance_by_turn, 'b-o', linewidth=2, markersize=8)
+    ax.set_xlabel('Turn Number', fontsize=12)
+    ax.set_ylabel('Compliance Rate', fontsize=12)
+    ax.set_title('Policy Erosion Curve', fontsize=14)
+    ax.set_ylim(0, 1.05)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'erosion_curve.png'), dpi=150)
+    fig.clear()
 
     # First failure distribution
     if metrics.first_failure_distribution:
-        plt.figure(figsize=(10, 6))
+        ax = fig.subplots()
         turns = sorted(metrics.first_failure_distribution.keys())
         counts = [metrics.first_failure_distribution[t] for t in turns]
-        plt.bar(turns, counts, color='coral', edgecolor='black')
-        plt.xlabel('First Failure Turn', fontsize=12)
-        plt.ylabel('Number of Attacks', fontsize=12)
-        plt.title('Delayed Failure Distribution', fontsize=14)
-        plt.xticks(turns)
-        plt.grid(True, alpha=0.3, axis='y')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'delayed_failure_dist.png'), dpi=150)
-        plt.close()
+        ax.bar(turns, counts, color='coral', edgecolor='black')
+        ax.set_xlabel('First Failure Turn', fontsize=12)
+        ax.set_ylabel('Number of Attacks', fontsize=12)
+        ax.set_title('Delayed Failure Distribution', fontsize=14)
+        ax.set_xticks(turns)
+        ax.grid(True, alpha=0.3, axis='y')
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, 'delayed_failure_dist.png'), dpi=150)
+        fig.clear()
 
     # Success by category
     if metrics.success_by_category:
-        plt.figure(figsize=(10, 6))
+        ax = fig.subplots()
         categories = list(metrics.success_by_category.keys())
         rates = [metrics.success_by_category[c] for c in categories]
         colors = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4']
-        plt.barh(categories, rates, color=colors[:len(categories)], edgecolor='black')
-        plt.xlabel('Attack Success Rate', fontsize=12)
-        plt.title('Success Rate by Attack Category', fontsize=14)
-        plt.xlim(0, 1)
+        ax.barh(categories, rates, color=colors[:len(categories)], edgecolor='black')
+        ax.set_xlabel('Attack Success Rate', fontsize=12)
+        ax.set_title('Success Rate by Attack Category', fontsize=14)
+        ax.set_xlim(0, 1)
         for i, rate in enumerate(rates):
-            plt.text(rate + 0.02, i, f'{rate:.1%}', va='center')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'success_by_category.png'), dpi=150)
-        plt.close()
+            ax.text(rate + 0.02, i, f'{rate:.1%}', va='center')
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, 'success_by_category.png'), dpi=150)
+        fig.clear()
 
     print(f"Plots saved to: {output_dir}/")
 
@@ -179,6 +241,10 @@ def main():
                        help='Task to inject into attacks')
     parser.add_argument('--failure-prob', type=float, default=0.3,
                        help='Simulated model failure probability')
+    parser.add_argument('--seed', type=int, default=42,
+                       help='Base random seed for reproducible runs')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes (default: cpu count, 1 = serial)')
     parser.add_argument('--output', type=str, default='results/raw.jsonl',
                        help='Output file for raw results')
     parser.add_argument('--plot', action='store_true',
@@ -195,7 +261,9 @@ def main():
         max_turns=args.turns,
         task=args.task,
         verbose=args.verbose,
-        failure_prob=args.failure_prob
+        failure_prob=args.failure_prob,
+        seed=args.seed,
+        workers=args.workers
     )
 
     # Compute metrics